@@ -10,6 +10,7 @@ import sqlite3
 import pandas as pd
 import plotly.express as px
 import base64
+import heapq
 from datetime import datetime, date, time
 from streamlit_calendar import calendar
 
@@ -56,6 +57,66 @@ def init_stats_db():
         conn.execute("INSERT OR IGNORE INTO stats(id,stars) VALUES(1,0);")
 init_stats_db()
 
+def init_changes_db():
+    # append-only change feed; MAX(id) is the version other sessions poll
+    with sqlite3.connect(DB) as conn:
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS changes (
+                id          INTEGER PRIMARY KEY AUTOINCREMENT,
+                task_id     INTEGER NOT NULL,
+                op          TEXT    NOT NULL,
+                changed_at  TEXT    DEFAULT (datetime('now','localtime'))
+            );
+            CREATE TRIGGER IF NOT EXISTS tasks_ins AFTER INSERT ON tasks
+            BEGIN
+                INSERT INTO changes(task_id,op) VALUES(NEW.id,'insert');
+            END;
+            CREATE TRIGGER IF NOT EXISTS tasks_upd AFTER UPDATE ON tasks
+            WHEN OLD.task IS NOT NEW.task OR OLD.priority IS NOT NEW.priority
+              OR OLD.due_date IS NOT NEW.due_date OR OLD.start_time IS NOT NEW.start_time
+              OR OLD.end_time IS NOT NEW.end_time OR OLD.done IS NOT NEW.done
+            BEGIN
+                INSERT INTO changes(task_id,op) VALUES(NEW.id,'update');
+            END;
+            CREATE TRIGGER IF NOT EXISTS tasks_del AFTER DELETE ON tasks
+            BEGIN
+                INSERT INTO changes(task_id,op) VALUES(OLD.id,'delete');
+            END;
+        """)
+init_changes_db()
+
+def init_completions_db():
+    # one row per task ticked done, kept after the task itself is cleared
+    with sqlite3.connect(DB) as conn:
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS completions (
+                id            INTEGER PRIMARY KEY AUTOINCREMENT,
+                task_id       INTEGER NOT NULL,
+                due_date      TEXT    NOT NULL,
+                start_time    TEXT    NOT NULL,
+                end_time      TEXT    NOT NULL,
+                completed_at  TEXT    DEFAULT (datetime('now','localtime'))
+            );
+            CREATE INDEX IF NOT EXISTS completions_at ON completions(completed_at);
+            CREATE INDEX IF NOT EXISTS completions_task ON completions(task_id);
+            CREATE TRIGGER IF NOT EXISTS tasks_done AFTER UPDATE OF done ON tasks
+            WHEN OLD.done = 0 AND NEW.done = 1
+            BEGIN
+                INSERT INTO completions(task_id,due_date,start_time,end_time)
+                VALUES(NEW.id,NEW.due_date,NEW.start_time,NEW.end_time);
+            END;
+            CREATE TRIGGER IF NOT EXISTS tasks_undone AFTER UPDATE OF done ON tasks
+            WHEN OLD.done = 1 AND NEW.done = 0
+            BEGIN
+                DELETE FROM completions WHERE id = (
+                    SELECT MAX(id) FROM completions WHERE task_id = OLD.id
+                );
+            END;
+        """)
+init_completions_db()
+
+get_version = lambda: run_q("SELECT COALESCE(MAX(id),0) FROM changes", fetch=True)[0][0]
+
 get_stars = lambda: run_q("SELECT stars FROM stats WHERE id=1", fetch=True)[0][0]
 add_star  = lambda n=1: run_q("UPDATE stats SET stars = stars + ? WHERE id=1", (n,))
 
@@ -77,6 +138,14 @@ update_task  = lambda i,t,p,d,st,en,done: run_q(
 delete_task  = lambda i: run_q("DELETE FROM tasks WHERE id=?", (i,))
 clear_done   = lambda: run_q("DELETE FROM tasks WHERE done=1")
 
+def set_done(i, done):
+    # returns whether the row actually flipped, so a stale tick awards nothing
+    with sqlite3.connect(DB) as conn:
+        return conn.execute(
+            "UPDATE tasks SET done=? WHERE id=? AND done<>?",
+            (int(done), i, int(done))
+        ).rowcount > 0
+
 
 if "logged_in" not in st.session_state:
     st.session_state.logged_in = False
@@ -129,22 +198,51 @@ if not st.session_state.logged_in:
 
 if "theme" not in st.session_state:
     st.session_state.theme = "Dark"
-if "sidebar_rows" not in st.session_state:
-    st.session_state.sidebar_rows = fetch_tasks()
+if "sidebar_ids" not in st.session_state:
+    st.session_state.sidebar_ids = None
+if "search_at" not in st.session_state:
+    st.session_state.search_at = datetime.min
+if "sidebar_order" not in st.session_state:
+    st.session_state.sidebar_order = []
 if "sidebar_search" not in st.session_state:
     st.session_state.sidebar_search = ""
 if "sidebar_filter" not in st.session_state:
     st.session_state.sidebar_filter = "All" 
 
 
-with st.sidebar:
-   
+def sort_rows(rows):
+    # priority, then done, then the order dragged in "Search & Reorder Tasks"
+    rank  = {tid: i for i, tid in enumerate(st.session_state.sidebar_order)}
+    order = {"High":0,"Medium":1,"Low":2}
+    return sorted(rows, key=lambda r:(order[r[2]], r[6], rank.get(r[0], len(rank))))
+
+def visible_rows():
+    rows = fetch_tasks()
+    if st.session_state.sidebar_ids is not None:
+        rows = [r for r in rows if r[0] in st.session_state.sidebar_ids]
+    rows = sort_rows(rows)
+    if st.session_state.sidebar_filter == "Priority Only":
+        rows = [r for r in rows if r[2]=="High"]
+    elif st.session_state.sidebar_filter == "Non-Priority Only":
+        rows = [r for r in rows if r[2]!="High"]
+    return rows
+
+
+SEARCH_SHOW = 100  # matches listed in the sidebar sorter and backlog
+
+# The sidebar only reruns itself; it asks for a full rerun when the task
+# filter changes or the Analytics page is entered or left. New search
+# results reach the page via change_watcher.
+@st.fragment
+def sidebar_menu(applied_filter, applied_page):
     page = st.radio(
         "🔧 Menu",
-        ["Home", "Search", "Reflection", "Settings"],
+        ["Home", "Search", "Analytics", "Reflection", "Settings"],
         index=0,
         key="sidebar_page"
     )
+    if (page == "Analytics") != (applied_page == "Analytics"):
+        st.rerun()
 
     if page == "Home":
         st.header("🔐 User")
@@ -168,48 +266,81 @@ with st.sidebar:
         )
 
         
-        all_rows = fetch_tasks()
-        order_map = {"High": 0, "Medium": 1, "Low": 2}
-        all_rows.sort(key=lambda r: (order_map[r[2]], r[6]))
-
-        if search_txt:
-            filtered = [r for r in all_rows if search_txt.lower() in r[1].lower()]
-        else:
-            filtered = all_rows
+        # Tasks are re-read and sorted only when the change log or the drag
+        # order moves; a query that extends the previous one narrows the
+        # previous matches (which stay sorted) instead of rescanning every task.
+        cache   = st.session_state.setdefault("search_cache", {})
+        version = get_version()
+        query   = search_txt.lower()
+        if (cache.get("version") != version
+                or cache.get("order") is not st.session_state.sidebar_order):
+            all_rows = sort_rows(fetch_tasks())
+            cache.clear()
+            cache.update(
+                version=version,
+                order=st.session_state.sidebar_order,
+                all=[(r[1].lower(), r) for r in all_rows],
+                query="",
+            )
+            cache["matches"] = cache["all"]
+        pool = cache["matches"] if query.startswith(cache["query"]) else cache["all"]
+        if query != cache["query"]:
+            cache["matches"] = [m for m in pool if query in m[0]]
+            cache["query"]   = query
+        filtered = [r for _, r in cache["matches"]]
 
         
-        items = [f"{r[0]}: {r[1]}" for r in filtered]
+        # Only the first matches are listed, so a broad query costs the same
+        # to render as a narrow one; the page still shows every match.
+        shown = filtered[:SEARCH_SHOW]
+        items = [f"{r[0]}: {r[1]}" for r in shown]
         new_order = sort_items(
             items,
-            key=f"sidebar_sort_{len(items)}",  # unique each time
+            # the component reads its items only when mounted, so remount it
+            # when the listed items change but not on reruns that keep them
+            key=f"sidebar_sort_{hash(tuple(items))}",
             direction="vertical",
             header=None,
             multi_containers=False,
         )
+        if len(filtered) > SEARCH_SHOW:
+            st.caption(f"{len(filtered) - SEARCH_SHOW} more… refine the search to reorder them.")
+
+        # A new drag moves the dragged ids to the front of the saved order;
+        # the rest keep their places. Values for another item set are ignored.
+        if new_order != items and new_order != st.session_state.get("sidebar_drag"):
+            st.session_state.sidebar_drag = new_order
+            dragged = [int(lbl.split(":", 1)[0]) for lbl in new_order]
+            moved   = set(dragged)
+            if moved == {r[0] for r in shown}:
+                st.session_state.sidebar_order = dragged + [
+                    tid for tid in st.session_state.sidebar_order if tid not in moved
+                ]
+                st.rerun()
 
         
-        sidebar_rows = []
-        for lbl in new_order:
-            tid, _ = lbl.split(":", 1)
-            for r in filtered:
-                if str(r[0]) == tid:
-                    sidebar_rows.append(r)
-                    break
-
-        
-        st.session_state.sidebar_rows = sidebar_rows
+        ids = {r[0] for r in filtered} if search_txt else None
+        if ids != st.session_state.sidebar_ids:
+            st.session_state.sidebar_ids = ids
+            st.session_state.search_at   = datetime.now()
 
       
         if search_txt:
             st.markdown("📜 Backlog (last 30 days)")
             cutoff = (date.today() - pd.Timedelta(days=30)).isoformat()
-            backlog = run_q(
-                "SELECT * FROM tasks WHERE task LIKE ? AND due_date>=? ORDER BY due_date DESC",
-                (f"%{search_txt}%", cutoff),
-                fetch=True,
-            )
-            for _, t, p, d, stt, ent, done in backlog:
-                st.write(f"- {d} ⏰ {stt}–{ent} ⭐ {p} Done={'Yes' if done else 'No'}")
+            recent  = [r for r in filtered if r[3] >= cutoff]
+            backlog = heapq.nlargest(SEARCH_SHOW, recent, key=lambda r: r[3])
+            # one markdown element for the whole list instead of one per task
+            st.markdown("\n".join(
+                f"- {d} ⏰ {stt}–{ent} ⭐ {p} Done={'Yes' if done else 'No'}"
+                for _, t, p, d, stt, ent, done in backlog
+            ))
+            if len(recent) > SEARCH_SHOW:
+                st.caption(f"{len(recent) - SEARCH_SHOW} more…")
+
+    elif page == "Analytics":
+        st.header("📊 Analytics")
+        st.caption("Completions per day or week, on-time rate, scheduled minutes and stars.")
 
     elif page == "Reflection":
       st.header("💭 Daily Reflection")
@@ -282,6 +413,11 @@ with st.sidebar:
                  ["All","Priority Only","Non-Priority Only"],
                  key="sidebar_filter"
         )
+        if st.session_state.sidebar_filter != applied_filter:
+            st.rerun()
+
+with st.sidebar:
+    sidebar_menu(st.session_state.sidebar_filter, st.session_state.get("sidebar_page"))
 
 
 
@@ -499,96 +635,234 @@ st.markdown(f"""
 """, unsafe_allow_html=True)
 
 
-st.title("📝 Todo List")
-st.markdown("### ➕ Add a New Task")
-
-voice_txt = ""
-if VOICE:
-    voice_txt = speech_to_text(
-        language="en",
-        start_prompt="🎙️ Speak",
-        stop_prompt="⏹️ Stop",
-        just_once=True,
-        key="mic"
-    ) or ""
-    if voice_txt:
-        st.success("Recognized: " + voice_txt)
-
-txt  = st.text_input("Task", value=voice_txt or "")
-prio = st.selectbox("Priority", ["High","Medium","Low"])
-due  = st.date_input("Due Date", date.today())
-stt  = st.time_input("Start Time", value=time(9,0))
-ent  = st.time_input("End Time",   value=time(18,0))
-
-if st.button("Add Task"):
-    if txt.strip():
-        add_task(txt.strip(), prio, due.isoformat(),
-                 stt.strftime("%H:%M"), ent.strftime("%H:%M"))
-        st.success("✅ Task added!")
-        st.rerun()
-    else:
-        st.warning("⚠️ Task cannot be empty")
+DAILY_SQL = """
+    SELECT date(completed_at)                  AS day,
+           COUNT(*)                            AS completed,
+           SUM(date(completed_at) <= due_date) AS on_time,
+           SUM((strftime('%s', end_time) - strftime('%s', start_time)) / 60.0) AS minutes
+    FROM completions
+    WHERE completed_at >= ? AND completed_at < ?
+    GROUP BY day
+    ORDER BY day
+"""
+daily_completions = lambda start, end: pd.DataFrame(
+    run_q(DAILY_SQL, (start, end), fetch=True),
+    columns=["day","completed","on_time","minutes"]
+)
 
+# New completions always land today, so past days only change when an
+# undo deletes one of theirs; the count of past completions catches that.
+# Past days are aggregated once per day and undo; only today's completions
+# are queried on each run.
+past_completions = lambda today: run_q(
+    "SELECT COUNT(*) FROM completions WHERE completed_at < ?", (today,), fetch=True
+)[0][0]
+
+@st.cache_data(max_entries=1)
+def completion_history(today, past_count):
+    return daily_completions("", today)
+
+def completion_trends(freq):
+    today = date.today().isoformat()
+    daily = pd.concat(
+        [completion_history(today, past_completions(today)), daily_completions(today, "9999")],
+        ignore_index=True
+    )
+    daily["day"] = pd.to_datetime(daily["day"])
+    trends = daily.set_index("day").resample(freq).sum()
+    trends["on_time_rate"] = trends["on_time"] / trends["completed"]
+    trends["avg_minutes"]  = trends["minutes"] / trends["completed"]
+    # one star per completion; offset so the last point matches the Points total
+    trends["stars"] = trends["completed"].cumsum() + get_stars() - trends["completed"].sum()
+    return trends.reset_index()
+
+@st.fragment
+def productivity_trends():
+    period = st.radio("Group by", ["Day","Week"], horizontal=True, key="trend_period")
+    trends = completion_trends("D" if period == "Day" else "W")
+    if trends.empty:
+        st.info("Complete some tasks to see your trends.")
+        return
+
+    c1, c2 = st.columns(2)
+    with c1:
+        done_bar = px.bar(
+            trends,
+            x="day",
+            y="completed",
+            title="Tasks Completed",
+            labels={"day":period,"completed":"# Completed"}
+        )
+        st.plotly_chart(done_bar, use_container_width=True)
+    with c2:
+        on_time = px.line(
+            trends,
+            x="day",
+            y="on_time_rate",
+            markers=True,
+            title="On-time Rate",
+            labels={"day":period,"on_time_rate":"Completed by due date"}
+        )
+        on_time.update_yaxes(tickformat=".0%", range=[0, 1])
+        st.plotly_chart(on_time, use_container_width=True)
+
+    c3, c4 = st.columns(2)
+    with c3:
+        duration = px.line(
+            trends,
+            x="day",
+            y="avg_minutes",
+            markers=True,
+            title="Average Scheduled Duration",
+            labels={"day":period,"avg_minutes":"Minutes"}
+        )
+        st.plotly_chart(duration, use_container_width=True)
+    with c4:
+        stars_line = px.line(
+            trends,
+            x="day",
+            y="stars",
+            title="Stars Earned Over Time",
+            labels={"day":period,"stars":"⭐ Stars"}
+        )
+        st.plotly_chart(stars_line, use_container_width=True)
 
-rows = st.session_state.get("sidebar_rows", fetch_tasks())
-order = {"High":0,"Medium":1,"Low":2}
-rows = sorted(rows, key=lambda r:(order[r[2]], r[6]))
-if st.session_state.sidebar_filter == "Priority Only":
-    rows = [r for r in rows if r[2]=="High"]
-elif st.session_state.sidebar_filter == "Non-Priority Only":
-    rows = [r for r in rows if r[2]!="High"]
 
+# The Analytics page replaces the task page, like the login page above it.
+if st.session_state.get("sidebar_page") == "Analytics":
+    st.title("📊 Productivity Trends")
+    productivity_trends()
+    st.stop()
 
-# Build a list of "id: task text" labels
-items = [f"{r[0]}: {r[1]}" for r in rows]
+st.title("📝 Todo List")
+st.markdown("### ➕ Add a New Task")
 
-# Render the draggable list (each bar now shows the task text)
-new_order = sort_items(
-    items,                    # <- pass labels positionally
-    key="task_sorter",
-    direction="vertical",
-    header=None,
-    multi_containers=False
+# Inputs live in a form so typing does not rerun anything until "Add Task".
+@st.fragment
+def add_task_form():
+    voice_txt = ""
+    if VOICE:
+        voice_txt = speech_to_text(
+            language="en",
+            start_prompt="🎙️ Speak",
+            stop_prompt="⏹️ Stop",
+            just_once=True,
+            key="mic"
+        ) or ""
+        if voice_txt:
+            st.success("Recognized: " + voice_txt)
+
+    with st.form("add_task_form", clear_on_submit=True):
+        txt  = st.text_input("Task", value=voice_txt or "")
+        prio = st.selectbox("Priority", ["High","Medium","Low"])
+        due  = st.date_input("Due Date", date.today())
+        stt  = st.time_input("Start Time", value=time(9,0))
+        ent  = st.time_input("End Time",   value=time(18,0))
+        submitted = st.form_submit_button("Add Task")
+
+    if submitted:
+        if txt.strip():
+            add_task(txt.strip(), prio, due.isoformat(),
+                     stt.strftime("%H:%M"), ent.strftime("%H:%M"))
+            st.success("✅ Task added!")
+            st.rerun()
+        else:
+            st.warning("⚠️ Task cannot be empty")
+
+add_task_form()
+
+
+st.session_state.page_run = st.session_state.get("page_run", 0) + 1
+page_key = (st.session_state.page_run, get_version())
+page_ids = st.session_state.sidebar_ids
+rows = visible_rows()
+
+# A page run hands the task list and calendar its rows; their own reruns
+# re-read the tasks only when the change log moved since.
+def live_rows(name, page_rows, page_key):
+    state = st.session_state.setdefault("live_rows", {}).setdefault(name, {})
+    if state.get("run") != page_key[0]:
+        state.update(run=page_key[0], version=page_key[1], rows=page_rows)
+        return page_rows, True
+    version = get_version()
+    if version != state["version"]:
+        state.update(version=version, rows=visible_rows())
+        return state["rows"], True
+    return state["rows"], False
+
+def own_write(before):
+    # This session's write is already on screen: move the polled version past
+    # it, unless another write landed in between.
+    after = get_version()
+    if after != before + 1:
+        return
+    for state in st.session_state.get("live_rows", {}).values():
+        if state.get("version") == before:
+            state["version"] = after
+
+# Only a widget callback can rerun other fragments by key, so the watcher
+# mounts this one-shot trigger when it sees a newer version; the trigger's
+# callback then reruns the task list and calendar.
+live_trigger = st.components.v2.component(
+    "live_trigger",
+    js="export default function({ data, setTriggerValue }) { setTriggerValue('changed', data) }",
 )
 
-# Re‐assemble `rows` in the new order
-ordered_rows = []
-for label in new_order:
-    id_str, _ = label.split(":", 1)
-    for r in rows:
-        if str(r[0]) == id_str:
-            ordered_rows.append(r)
-            break
-
-rows = ordered_rows
-
-
-if not rows:
-    st.info("No tasks to show.")
-else:
-    for tid, task, pr, dd, stt_val, ent_val, done in rows:
-        c1, c2 = st.columns([6,1])
-
-        with c1:
-            st.markdown(f'<div class="task-title">{task}</div>', unsafe_allow_html=True)
-            st.markdown(
-                f'<div class="task-meta">📅 {dd}   ⏰ {stt_val}–{ent_val}   ⭐ {pr}</div>',
-                unsafe_allow_html=True
-            )
+def refresh_live():
+    st.rerun(["task_list", "task_calendar"])
+
+SEARCH_DEBOUNCE = 0.5  # seconds a search result must stay put before the page follows
+
+# Polls only the change-log version; another session's write reruns the task
+# list and calendar. Search results are applied with a page run once the
+# query has settled, so a burst of keystrokes costs one run.
+@st.fragment(run_every="1s")
+def change_watcher(page_ids):
+    version = get_version()
+    if any(s["version"] != version for s in st.session_state.get("live_rows", {}).values()):
+        live_trigger(data=version, key=f"live_{version}", on_changed_change=refresh_live)
+    settled = (datetime.now() - st.session_state.search_at).total_seconds() >= SEARCH_DEBOUNCE
+    if st.session_state.sidebar_ids != page_ids and settled:
+        st.rerun()
 
-            # ⭐— done‐checkbox + star logic (NOT inside any expander) —⭐
-            prev_done = bool(done)
-            done_val  = st.checkbox("✅ Done", value=prev_done, key=f"done_{tid}")
 
-            if done_val != prev_done:
-                if done_val:
-                    add_star(1)
-                    st.success("⭐ You earned a star!")
-                update_task(tid, task, pr, dd, stt_val, ent_val, done_val)
-            else:
-                update_task(tid, task, pr, dd, stt_val, ent_val, done_val)
+def toggle_done(tid):
+    # on_change: only a click writes, never a rerun that sees a newer DB row
+    done   = st.session_state[f"done_{tid}"]
+    before = get_version()
+    if set_done(tid, done):
+        own_write(before)
+        if done:
+            add_star(1)
+            st.session_state.starred = tid
+
+# Each row reruns on its own: ticking "Done" only touches that row. The
+# checkbox state, not `done`, is the current value between page runs.
+@st.fragment
+def task_row(row):
+    tid, task, pr, dd, stt_val, ent_val, done = row
+    c1, c2 = st.columns([6,1])
+
+    with c1:
+        st.markdown(f'<div class="task-title">{task}</div>', unsafe_allow_html=True)
+        st.markdown(
+            f'<div class="task-meta">📅 {dd}   ⏰ {stt_val}–{ent_val}   ⭐ {pr}</div>',
+            unsafe_allow_html=True
+        )
 
-            with st.expander("Edit Task"):
+        # ⭐— done‐checkbox + star logic (NOT inside any expander) —⭐
+        done_val = st.checkbox(
+            "✅ Done", key=f"done_{tid}",
+            on_change=toggle_done, args=(tid,)
+        )
+        if st.session_state.get("starred") == tid:
+            del st.session_state.starred
+            st.success("⭐ You earned a star!")
+
+        # the edit inputs only run while the expander is open: each keyed
+        # input scans the whole session state, so one set per row is quadratic
+        with st.expander("Edit Task", key=f"edit_{tid}", on_change="rerun") as edit:
+            if edit.open:
                 new_txt = st.text_input("Task", value=task, key=f"edit_txt_{tid}")
                 new_pr  = st.selectbox(
                     "Priority", ["High","Medium","Low"],
@@ -620,33 +894,52 @@ else:
                     st.success("✅ Task updated!")
                     st.rerun()
 
-        with c2:
-            if st.button("🗑️", key=f"del_{tid}"):
-                delete_task(tid)
-                st.rerun()
+    with c2:
+        if st.button("🗑️", key=f"del_{tid}"):
+            delete_task(tid)
+            st.rerun()
+
+
+@st.fragment(key="task_list")
+def task_list(page_rows, page_key):
+    rows, fresh = live_rows("list", page_rows, page_key)
+    if not rows:
+        st.info("No tasks to show.")
+        return
+
+    # Build a list of "id: task text" labels
+    items = [f"{r[0]}: {r[1]}" for r in rows]
+
+    # Render the draggable list (each bar now shows the task text); it reads
+    # its items only when mounted, so it is remounted when they change
+    new_order = sort_items(
+        items,                    # <- pass labels positionally
+        key=f"task_sorter_{hash(tuple(items))}",
+        direction="vertical",
+        header=None,
+        multi_containers=False
+    )
+
+    # Re‐assemble `rows` in the new order
+    by_label = dict(zip(items, rows))
+    rows = [by_label[label] for label in new_order if label in by_label]
+
+    for row in rows:
+        key = f"done_{row[0]}"
+        if fresh or key not in st.session_state:
+            # widget state would otherwise keep this session's old value
+            st.session_state[key] = bool(row[6])
+        task_row(row)
 
     if st.button("🧹 Clear Completed"):
         clear_done()
         st.rerun()
 
+task_list(rows, page_key)
+
 
 st.markdown("---")
 st.subheader("📆 Calendar View")
-if st.button("🔁 Refresh Calendar"):
-    st.rerun()
-
-events, seen = [], set()
-for tid, task, pr, dd, stt, ent, done in rows:
-    key = (tid, stt, ent)
-    if key in seen: continue
-    seen.add(key)
-    events.append({
-        "id":    str(tid),
-        "title": f"{task} ({pr})",
-        "start": f"{dd}T{stt}",
-        "end":   f"{dd}T{ent}",
-        "allDay": False
-    })
 
 st.markdown("""
 <style>
@@ -671,20 +964,40 @@ calendar_options = {
         "right":  "timeGridWeek,timeGridDay"
     }
 }
-calendar(events=events, options=calendar_options)
+
+# Navigating weeks only reruns the calendar; outside changes rerun it
+# together with the task list.
+@st.fragment(key="task_calendar")
+def calendar_view(page_rows, page_key):
+    cal_rows, _ = live_rows("calendar", page_rows, page_key)
+    events, seen = [], set()
+    for tid, task, pr, dd, stt, ent, done in cal_rows:
+        key = (tid, stt, ent)
+        if key in seen: continue
+        seen.add(key)
+        events.append({
+            "id":    str(tid),
+            "title": f"{task} ({pr})",
+            "start": f"{dd}T{stt}",
+            "end":   f"{dd}T{ent}",
+            "allDay": False
+        })
+    calendar(events=events, options=calendar_options, key="task_calendar")
+
+calendar_view(rows, page_key)
+
+change_watcher(page_ids)
 
 
 st.markdown("---")
 st.subheader("📈 Summary Visuals")
 
-df_sum = pd.DataFrame(rows, columns=[
-    "id","task","priority","due_date","start_time","end_time","done"
-])
-df_sum["Status"] = df_sum["done"].map({0:"Not Completed",1:"Completed"})
+def summary_figures(sum_rows):
+    df_sum = pd.DataFrame(sum_rows, columns=[
+        "id","task","priority","due_date","start_time","end_time","done"
+    ])
+    df_sum["Status"] = df_sum["done"].map({0:"Not Completed",1:"Completed"})
 
-c1, c2, c3 = st.columns(3)
-
-with c1:
     pie = px.pie(
         df_sum,
         names="Status",
@@ -696,9 +1009,7 @@ with c1:
             "Not Completed":"red"
         }
     )
-    st.plotly_chart(pie, use_container_width=True)
 
-with c2:
     by_date = df_sum.groupby("due_date").size().reset_index(name="count")
     bar_date = px.bar(
         by_date,
@@ -707,9 +1018,7 @@ with c2:
         title="Tasks by Due Date",
         labels={"due_date":"Due Date","count":"# Tasks"}
     )
-    st.plotly_chart(bar_date, use_container_width=True)
 
-with c3:
     by_pr = df_sum.groupby("priority").size().reset_index(name="count")
     bar_pr = px.bar(
         by_pr,
@@ -724,7 +1033,24 @@ with c3:
         title="Tasks by Priority",
         labels={"priority":"Priority","# Tasks":"count"}
     )
-    st.plotly_chart(bar_pr, use_container_width=True)
-
-
-    
+    return pie, bar_date, bar_pr
+
+# Drawn once per page run from the page's rows, so outside changes show up
+# here with the next page run. The figures are rebuilt only when the data or
+# the set of visible tasks changed, not on reruns caused by other widgets.
+def summary_visuals(sum_rows, page_version):
+    figs_key = (page_version, frozenset(r[0] for r in sum_rows))
+    if st.session_state.get("sum_figs_key") != figs_key:
+        st.session_state.sum_figs     = summary_figures(sum_rows)
+        st.session_state.sum_figs_key = figs_key
+    pie, bar_date, bar_pr = st.session_state.sum_figs
+
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        st.plotly_chart(pie, use_container_width=True)
+    with c2:
+        st.plotly_chart(bar_date, use_container_width=True)
+    with c3:
+        st.plotly_chart(bar_pr, use_container_width=True)
+
+summary_visuals(rows, page_key[1])